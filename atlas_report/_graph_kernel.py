@@ -0,0 +1,100 @@
+"""Optional compiled graph kernel — numba-accelerated depth computation.
+
+Converts the string-keyed CALLS adjacency into a CSR layout over dense
+integer node indices and runs an iterative DFS in machine code. numba and
+numpy are optional (install the ``speed`` extra); when they are missing,
+``HAVE_NUMBA`` is False and the scorer falls back to its pure-Python DFS.
+"""
+
+from __future__ import annotations
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # pragma: no cover
+    np = None
+    njit = None
+
+HAVE_NUMBA = njit is not None
+
+
+if HAVE_NUMBA:
+
+    @njit(cache=True)
+    def _max_depth_csr(indptr, indices, roots):  # pragma: no cover
+        n = indptr.shape[0] - 1
+        depth = np.zeros(n, dtype=np.int32)
+        # 0 = unvisited, 1 = in progress (cycle guard), 2 = done
+        state = np.zeros(n, dtype=np.int8)
+        stack = np.empty(n, dtype=np.int32)
+        cursor = np.empty(n, dtype=np.int32)
+        best = 0
+        for r in roots:
+            if state[r] != 2:
+                top = 0
+                stack[0] = r
+                cursor[0] = indptr[r]
+                state[r] = 1
+                while top >= 0:
+                    node = stack[top]
+                    i = cursor[top]
+                    if i < indptr[node + 1]:
+                        cursor[top] = i + 1
+                        child = indices[i]
+                        if state[child] == 0:
+                            state[child] = 1
+                            top += 1
+                            stack[top] = child
+                            cursor[top] = indptr[child]
+                    else:
+                        d = 1
+                        for j in range(indptr[node], indptr[node + 1]):
+                            c = indices[j]
+                            if state[c] == 2 and depth[c] + 1 > d:
+                                d = depth[c] + 1
+                        depth[node] = d
+                        state[node] = 2
+                        top -= 1
+            if depth[r] > best:
+                best = depth[r]
+        return best
+
+
+def max_depth(adj: dict[str, list[str]], roots: list[str]) -> int:
+    """Longest CALLS chain from any root, computed via the CSR kernel.
+
+    Args:
+        adj: source node id -> list of CALLS target ids.
+        roots: node ids to start from (pipeline roots).
+
+    Returns:
+        Depth of the longest chain (a lone root counts as 1).
+    """
+    if not roots:
+        return 0
+
+    # Intern string ids to dense int indices covering every node we can reach.
+    id_to_idx: dict[str, int] = {}
+    for src, targets in adj.items():
+        if src not in id_to_idx:
+            id_to_idx[src] = len(id_to_idx)
+        for t in targets:
+            if t not in id_to_idx:
+                id_to_idx[t] = len(id_to_idx)
+    for r in roots:
+        if r not in id_to_idx:
+            id_to_idx[r] = len(id_to_idx)
+
+    n = len(id_to_idx)
+    counts = np.zeros(n + 1, dtype=np.int32)
+    for src, targets in adj.items():
+        counts[id_to_idx[src] + 1] = len(targets)
+    indptr = np.cumsum(counts, dtype=np.int32)
+    indices = np.empty(indptr[-1], dtype=np.int32)
+    for src, targets in adj.items():
+        start = indptr[id_to_idx[src]]
+        for k, t in enumerate(targets):
+            indices[start + k] = id_to_idx[t]
+
+    roots_arr = np.fromiter((id_to_idx[r] for r in roots), dtype=np.int32, count=len(roots))
+    return int(_max_depth_csr(indptr, indices, roots_arr))
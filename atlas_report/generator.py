@@ -9,7 +9,7 @@ Usage:
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, Callable
 
 from atlas_sdk.models.findings import Finding
 from atlas_sdk.models.graph import CICDGraph
@@ -26,13 +26,30 @@ logger = logging.getLogger(__name__)
 class ReportGenerator:
     """Generates Markdown and JSON reports from graph + findings."""
 
+    _CACHE_SIZE = 8
+
+    def __init__(self) -> None:
+        self._data_cache: dict[tuple[Any, ...], ReportData] = {}
+        self._render_cache: dict[tuple[Any, ...], str] = {}
+
     def generate(
         self,
         graph: CICDGraph,
         findings: list[Finding],
         modernization_notes: str = "",
     ) -> ReportData:
-        """Compute scores and assemble report data."""
+        """Compute scores and assemble report data.
+
+        Results are cached per (graph, findings, notes) identity so that
+        rendering the same scan in several formats only scores it once.
+        Node/edge/finding counts are part of the key, so a graph mutated
+        in place between calls is re-scored.
+        """
+        key = _cache_key(graph, findings, modernization_notes)
+        cached = self._data_cache.get(key)
+        if cached is not None:
+            return cached
+
         scores = compute_scores(graph)
         data = ReportData(
             graph=graph,
@@ -45,6 +62,9 @@ class ReportGenerator:
             len(graph.nodes), len(findings),
             scores.complexity_score, scores.fragility_score,
         )
+        if len(self._data_cache) >= self._CACHE_SIZE:
+            self._data_cache.clear()
+        self._data_cache[key] = data
         return data
 
     def generate_markdown(
@@ -54,8 +74,7 @@ class ReportGenerator:
         modernization_notes: str = "",
     ) -> str:
         """Generate a full Markdown report."""
-        data = self.generate(graph, findings, modernization_notes)
-        return render_markdown(data)
+        return self._render_cached(render_markdown, graph, findings, modernization_notes)
 
     def generate_json(
         self,
@@ -64,8 +83,7 @@ class ReportGenerator:
         modernization_notes: str = "",
     ) -> str:
         """Generate a full JSON report."""
-        data = self.generate(graph, findings, modernization_notes)
-        return render_json(data)
+        return self._render_cached(render_json, graph, findings, modernization_notes)
 
     def generate_executive(
         self,
@@ -77,3 +95,36 @@ class ReportGenerator:
         data = self.generate(graph, findings, modernization_notes)
         return render_executive(data)
 
+    def _render_cached(
+        self,
+        renderer: Callable[[ReportData], str],
+        graph: CICDGraph,
+        findings: list[Finding],
+        modernization_notes: str,
+    ) -> str:
+        """Render via `renderer`, caching the output string.
+
+        Scans are commonly rendered (and uploaded) more than once per
+        format; the cache key mirrors the ReportData cache so in-place
+        graph mutation invalidates both.
+        """
+        key = (renderer.__name__, *_cache_key(graph, findings, modernization_notes))
+        cached = self._render_cache.get(key)
+        if cached is not None:
+            return cached
+        out = renderer(self.generate(graph, findings, modernization_notes))
+        if len(self._render_cache) >= self._CACHE_SIZE:
+            self._render_cache.clear()
+        self._render_cache[key] = out
+        return out
+
+
+def _cache_key(
+    graph: CICDGraph, findings: list[Finding], modernization_notes: str
+) -> tuple[Any, ...]:
+    """Identity-plus-size key for a (graph, findings, notes) triple."""
+    return (
+        id(graph), len(graph.nodes), len(graph.edges),
+        id(findings), len(findings), modernization_notes,
+    )
+
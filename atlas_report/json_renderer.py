@@ -3,78 +3,155 @@
 from __future__ import annotations
 
 import json
-from typing import Any
+from typing import Any, BinaryIO
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+from atlas_sdk.enums import EdgeType, NodeType, Severity
+from atlas_sdk.models.findings import Evidence, Finding
 
 from atlas_report.report_data import ReportData
 
+# Enum -> display-string tables, built once: str() on an Enum member
+# allocates on every call, and these conversions sit in per-node/per-edge
+# loops below.
+_NT_STR = {t: str(t) for t in NodeType}
+_ET_STR = {t: str(t) for t in EdgeType}
+_SEV_STR = {t: str(t) for t in Severity}
+
 
 def render_json(data: ReportData, indent: int = 2) -> str:
-    """Render the report as JSON string."""
+    """Render the report as JSON string.
+
+    Uses orjson (C encoder) when available — roughly 2x faster than the
+    stdlib on large graphs — and falls back to stdlib json otherwise.
+    """
     report = build_json_dict(data)
-    return json.dumps(report, indent=indent, default=str)
+    if orjson is not None:
+        # Hand dataclass-based models to the default hook instead of
+        # letting orjson serialize their raw fields natively.
+        option = orjson.OPT_PASSTHROUGH_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(report, option=option, default=_json_default).decode()
+    return json.dumps(report, indent=indent, default=_json_default)
+
+
+def render_json_stream(data: ReportData, out: BinaryIO) -> None:
+    """Stream the report as compact JSON bytes to a file-like object.
+
+    Encodes the small sections in one shot each and the dependencies and
+    findings lists one element at a time, so the full report dict is
+    never materialized — peak memory stays flat for very large graphs.
+    Falls back to a single encoded write when orjson is unavailable.
+    """
+    if orjson is None:
+        out.write(json.dumps(build_json_dict(data), default=_json_default).encode())
+        return
+
+    dumps = orjson.dumps
+    out.write(b'{"meta":')
+    out.write(dumps(_meta_dict(data)))
+    out.write(b',"scores":')
+    out.write(dumps(_scores_dict(data.scores)))
+    out.write(b',"structure":')
+    out.write(dumps(_structure_dict(data)))
+
+    out.write(b',"dependencies":[')
+    id_to_name = {n.id: n.name for n in data.graph.nodes}
+    for i, e in enumerate(data.graph.edges):
+        if i:
+            out.write(b",")
+        out.write(dumps(_edge_dict(e, id_to_name)))
+
+    out.write(b'],"findings":[')
+    for i, f in enumerate(data.findings):
+        if i:
+            out.write(b",")
+        out.write(dumps(f, option=orjson.OPT_PASSTHROUGH_DATACLASS, default=_json_default))
+
+    out.write(b'],"modernization_roadmap":')
+    out.write(dumps(data.modernization_notes or None))
+    out.write(b"}")
 
 
 def build_json_dict(data: ReportData) -> dict[str, Any]:
-    """Build a JSON-serializable dict of the full report."""
-    s = data.scores
+    """Build a dict of the full report.
+
+    The findings list is kept as model objects and converted lazily by
+    the encoder's default hook (see ``_json_default``), so a report with
+    thousands of findings is not materialized twice.
+    """
+    id_to_name = {n.id: n.name for n in data.graph.nodes}
     return {
-        "meta": {
-            "pipeline": data.graph.name,
-            "generated_at": data.generated_at,
-            "node_count": len(data.graph.nodes),
-            "edge_count": len(data.graph.edges),
-            "finding_count": len(data.findings),
-        },
-        "scores": {
-            "complexity": {
-                "score": s.complexity_score,
-                "nodes": s.node_count,
-                "edges": s.edge_count,
-                "max_depth": s.max_depth,
-                "max_fan_out": s.max_fan_out,
-            },
-            "fragility": {
-                "score": s.fragility_score,
-                "secrets": s.secret_count,
-                "cross_triggers": s.cross_trigger_count,
-                "unpinned_images": s.unpinned_image_count,
-                "missing_doc_types": s.missing_doc_types,
-            },
+        "meta": _meta_dict(data),
+        "scores": _scores_dict(data.scores),
+        "structure": _structure_dict(data),
+        "dependencies": [_edge_dict(e, id_to_name) for e in data.graph.edges],
+        "findings": data.findings,
+        "modernization_roadmap": data.modernization_notes or None,
+    }
+
+
+def _meta_dict(data: ReportData) -> dict[str, Any]:
+    return {
+        "pipeline": data.graph.name,
+        "generated_at": data.generated_at,
+        "node_count": len(data.graph.nodes),
+        "edge_count": len(data.graph.edges),
+        "finding_count": len(data.findings),
+    }
+
+
+def _scores_dict(s: Any) -> dict[str, Any]:
+    return {
+        "complexity": {
+            "score": s.complexity_score,
+            "nodes": s.node_count,
+            "edges": s.edge_count,
+            "max_depth": s.max_depth,
+            "max_fan_out": s.max_fan_out,
         },
-        "structure": {
-            node_type: [n.name for n in data.graph.nodes if str(n.node_type) == node_type]
-            for node_type in sorted({str(n.node_type) for n in data.graph.nodes})
+        "fragility": {
+            "score": s.fragility_score,
+            "secrets": s.secret_count,
+            "cross_triggers": s.cross_trigger_count,
+            "unpinned_images": s.unpinned_image_count,
+            "missing_doc_types": s.missing_doc_types,
         },
-        "dependencies": [
-            {
-                "source": _node_name(data, e.source_node_id),
-                "edge_type": str(e.edge_type),
-                "target": _node_name(data, e.target_node_id),
-            }
-            for e in data.graph.edges
-        ],
-        "findings": [
-            {
-                "rule_id": f.rule_id,
-                "title": f.title,
-                "description": f.description,
-                "severity": str(f.severity),
-                "confidence": getattr(f.confidence, "level", "unknown") if f.confidence else "unknown",
-                "recommendation": f.recommendation,
-                "evidence": [
-                    {"description": ev.description}
-                    for ev in f.evidence
-                ],
-            }
-            for f in data.findings
-        ],
-        "modernization_roadmap": data.modernization_notes or None,
     }
 
 
-def _node_name(data: ReportData, node_id: str) -> str:
-    """Resolve node ID to name."""
+def _structure_dict(data: ReportData) -> dict[str, list[str]]:
+    structure: dict[str, list[str]] = {}
     for n in data.graph.nodes:
-        if n.id == node_id:
-            return n.name
-    return node_id[:8]
+        structure.setdefault(_NT_STR[n.node_type], []).append(n.name)
+    return dict(sorted(structure.items()))
+
+
+def _edge_dict(e: Any, id_to_name: dict[str, str]) -> dict[str, str]:
+    return {
+        "source": id_to_name.get(e.source_node_id, e.source_node_id[:8]),
+        "edge_type": _ET_STR[e.edge_type],
+        "target": id_to_name.get(e.target_node_id, e.target_node_id[:8]),
+    }
+
+
+def _json_default(obj: Any) -> Any:
+    """Encoder hook: serialize Finding/Evidence in place, str() the rest."""
+    if isinstance(obj, Finding):
+        return {
+            "rule_id": obj.rule_id,
+            "title": obj.title,
+            "description": obj.description,
+            "severity": _SEV_STR[obj.severity],
+            "confidence": getattr(obj.confidence, "level", "unknown") if obj.confidence else "unknown",
+            "recommendation": obj.recommendation,
+            "evidence": obj.evidence,
+        }
+    if isinstance(obj, Evidence):
+        return {"description": obj.description}
+    return str(obj)
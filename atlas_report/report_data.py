@@ -12,10 +12,14 @@ from atlas_sdk.models.graph import CICDGraph
 from atlas_report.scorer import Scores
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ReportData:
     """Everything needed to render a report.
 
+    Frozen and slotted: instances are assembled once by the generator
+    and only read by renderers, and batch report runs create many of
+    them.
+
     Sections (per docs/README.md §8):
     1. Structure Map
     2. Dependency Graph
@@ -30,5 +34,18 @@ class ReportData:
     graph: CICDGraph
     findings: list[Finding]
     scores: Scores
-    generated_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
     modernization_notes: str = ""  # Populated by atlas-ai in Phase 2
+    _generated_at: str | None = field(default=None, repr=False)
+
+    @property
+    def generated_at(self) -> str:
+        """Generation timestamp (UTC ISO 8601), formatted on first access.
+
+        Computed lazily so batch scoring runs that never render don't
+        pay for datetime formatting per instance.
+        """
+        if self._generated_at is None:
+            object.__setattr__(
+                self, "_generated_at", datetime.now(timezone.utc).isoformat()
+            )
+        return self._generated_at
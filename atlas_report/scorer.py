@@ -7,14 +7,20 @@ Maturity: based on caching, parallelism, pinned deps, doc coverage, retries, env
 
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import Any
 
 from atlas_sdk.enums import EdgeType, NodeType
 from atlas_sdk.models.graph import CICDGraph
 
+from atlas_report import _graph_kernel
 
-@dataclass
+_UNPINNED_TAGS = frozenset({"latest", "stable", "nightly"})
+_EXPECTED_DOCS = frozenset({"readme", "architecture", "runbook", "security_policy", "codeowners"})
+
+
+@dataclass(slots=True, frozen=True)
 class Scores:
     """Aggregated complexity and fragility scores."""
 
@@ -43,122 +49,207 @@ class Scores:
 
 
 def compute_scores(graph: CICDGraph) -> Scores:
-    """Compute complexity and fragility scores from a CICDGraph."""
-    s = Scores()
+    """Compute complexity and fragility scores from a CICDGraph.
 
+    Metrics accumulate in locals and the frozen Scores is built with a
+    single constructor call at the end.
+    """
     # ── Complexity ────────────────────────────────────────────
-    s.node_count = len(graph.nodes)
-    s.edge_count = len(graph.edges)
-
-    # Max fan-out: most outgoing edges from any single node
-    fan_out: dict[str, int] = {}
+    node_count = len(graph.nodes)
+    edge_count = len(graph.edges)
+
+    # Single pass over edges: fan-out counts, cross-trigger count, and a
+    # CALLS adjacency index (source id -> target ids) so depth
+    # computation never rescans edges.
+    fan_out: defaultdict[str, int] = defaultdict(int)
+    calls_adj: dict[str, list[str]] = {}
+    cross_trigger_count = 0
     for edge in graph.edges:
-        fan_out[edge.source_node_id] = fan_out.get(edge.source_node_id, 0) + 1
-    s.max_fan_out = max(fan_out.values(), default=0)
+        src = edge.source_node_id
+        fan_out[src] += 1
+        edge_type = edge.edge_type
+        if edge_type is EdgeType.CALLS:
+            calls_adj.setdefault(src, []).append(edge.target_node_id)
+        elif edge_type is EdgeType.TRIGGERS:
+            cross_trigger_count += 1
+    max_fan_out = max(fan_out.values(), default=0)
+
+    # Single pass over nodes: classify by type into buckets and sweep the
+    # maturity attributes (cache/retry commands, parallel stages) so the
+    # complexity/fragility/maturity sections below never re-walk the graph.
+    pipelines: list[Any] = []
+    images: list[Any] = []
+    secret_count = 0
+    unpinned_count = 0
+    env_count = 0
+    found_docs: set[str] = set()
+    has_caching = False
+    has_parallelism = False
+    has_retries = False
+    for n in graph.nodes:
+        t = n.node_type
+        if t is NodeType.PIPELINE:
+            pipelines.append(n)
+        elif t is NodeType.STEP:
+            cmd = (getattr(n, "command", "") or "").lower()
+            if "cache" in cmd:
+                has_caching = True
+        elif t is NodeType.STAGE:
+            if getattr(n, "parallel", False):
+                has_parallelism = True
+        elif t is NodeType.CONTAINER_IMAGE:
+            images.append(n)
+            if getattr(n, "tag", "latest") in _UNPINNED_TAGS:
+                unpinned_count += 1
+        elif t is NodeType.SECRET_REF:
+            secret_count += 1
+        elif t is NodeType.ENVIRONMENT:
+            env_count += 1
+        elif t is NodeType.DOC_FILE:
+            found_docs.add(_doc_type_str(n))
+
+        if not has_retries:
+            cmd = getattr(n, "command", None)
+            if cmd and "retry" in cmd.lower():
+                has_retries = True
+            else:
+                # Check metadata entries individually — stringifying the
+                # whole dict per node is what made this sweep expensive.
+                md = getattr(n, "metadata", None)
+                if md and any(
+                    "retry" in str(k) or "retry" in str(v) for k, v in md.items()
+                ):
+                    has_retries = True
 
     # Depth: longest chain of CALLS edges from any pipeline
-    pipelines = [n for n in graph.nodes if n.node_type == NodeType.PIPELINE]
-    for p in pipelines:
-        depth = _compute_depth(graph, p.id, set())
-        s.max_depth = max(s.max_depth, depth)
+    max_depth = 0
+    if _graph_kernel.HAVE_NUMBA and pipelines:
+        max_depth = _graph_kernel.max_depth(calls_adj, [p.id for p in pipelines])
+    else:
+        depth_cache: dict[str, int] = {}
+        in_progress: set[str] = set()
+        for p in pipelines:
+            depth = _compute_depth(calls_adj, p.id, depth_cache, in_progress)
+            max_depth = max(max_depth, depth)
 
     # Complexity score: weighted formula (capped at 100)
-    raw = (s.node_count * 1.0) + (s.edge_count * 1.5) + (s.max_depth * 5) + (s.max_fan_out * 3)
-    s.complexity_score = min(round(raw, 1), 100.0)
+    raw = (node_count * 1.0) + (edge_count * 1.5) + (max_depth * 5) + (max_fan_out * 3)
+    complexity_score = min(round(raw, 1), 100.0)
 
     # ── Fragility ─────────────────────────────────────────────
-    s.secret_count = sum(1 for n in graph.nodes if n.node_type == NodeType.SECRET_REF)
-    s.cross_trigger_count = sum(1 for e in graph.edges if e.edge_type == EdgeType.TRIGGERS)
-    s.unpinned_image_count = sum(
-        1 for n in graph.nodes
-        if n.node_type == NodeType.CONTAINER_IMAGE
-        and getattr(n, "tag", "latest") in ("latest", "stable", "nightly")
-    )
-
-    expected_docs = {"readme", "architecture", "runbook", "security_policy", "codeowners"}
-    found_docs = {
-        getattr(n, "doc_type", "").value
-        if hasattr(getattr(n, "doc_type", ""), "value")
-        else str(getattr(n, "doc_type", ""))
-        for n in graph.nodes
-        if n.node_type == NodeType.DOC_FILE
-    }
-    s.missing_doc_types = len(expected_docs - found_docs)
+    missing_doc_types = len(_EXPECTED_DOCS - found_docs)
 
     frag_raw = (
-        s.secret_count * 5
-        + s.cross_trigger_count * 10
-        + s.unpinned_image_count * 15
-        + s.missing_doc_types * 8
+        secret_count * 5
+        + cross_trigger_count * 10
+        + unpinned_count * 15
+        + missing_doc_types * 8
     )
-    s.fragility_score = min(round(frag_raw, 1), 100.0)
+    fragility_score = min(round(frag_raw, 1), 100.0)
 
     # ── Maturity ──────────────────────────────────────────────
     maturity_points = 0
     max_points = 6  # 6 dimensions, each worth ~16.7 points
 
-    # 1. Caching: any step/job referencing "cache"
-    step_nodes = [n for n in graph.nodes if n.node_type == NodeType.STEP]
-    s.has_caching = any(
-        "cache" in (getattr(n, "command", "") or "").lower()
-        for n in step_nodes
-    )
-    if s.has_caching:
+    # 1. Caching: any step/job referencing "cache" (swept in the node pass)
+    if has_caching:
         maturity_points += 1
 
     # 2. Parallelism: any stage with parallel=True or multiple jobs from one pipeline
-    stages = [n for n in graph.nodes if n.node_type == NodeType.STAGE]
-    s.has_parallelism = any(getattr(n, "parallel", False) for n in stages)
-    if not s.has_parallelism and s.max_fan_out >= 2:
-        s.has_parallelism = True
-    if s.has_parallelism:
+    if not has_parallelism and max_fan_out >= 2:
+        has_parallelism = True
+    if has_parallelism:
         maturity_points += 1
 
     # 3. Pinned images
-    images = [n for n in graph.nodes if n.node_type == NodeType.CONTAINER_IMAGE]
     if images:
         pinned = sum(1 for n in images if getattr(n, "pinned", False))
-        s.pinned_image_ratio = pinned / len(images)
+        pinned_image_ratio = pinned / len(images)
     else:
-        s.pinned_image_ratio = 1.0  # No images = no risk
-    if s.pinned_image_ratio >= 0.8:
+        pinned_image_ratio = 1.0  # No images = no risk
+    if pinned_image_ratio >= 0.8:
         maturity_points += 1
 
     # 4. Doc coverage
-    expected_docs = {"readme", "architecture", "runbook", "security_policy", "codeowners"}
-    s.doc_coverage = 1.0 - (s.missing_doc_types / len(expected_docs)) if expected_docs else 1.0
-    if s.doc_coverage >= 0.6:
+    doc_coverage = 1.0 - (missing_doc_types / len(_EXPECTED_DOCS))
+    if doc_coverage >= 0.6:
         maturity_points += 1
 
-    # 5. Retry policies
-    s.has_retries = any(
-        "retry" in (getattr(n, "command", "") or "").lower()
-        or "retry" in str(getattr(n, "metadata", {}))
-        for n in graph.nodes
-    )
-    if s.has_retries:
+    # 5. Retry policies (swept in the node pass)
+    if has_retries:
         maturity_points += 1
 
     # 6. Environment isolation
-    env_nodes = [n for n in graph.nodes if n.node_type == NodeType.ENVIRONMENT]
-    s.has_env_isolation = len(env_nodes) >= 2
-    if s.has_env_isolation:
+    has_env_isolation = env_count >= 2
+    if has_env_isolation:
         maturity_points += 1
 
-    s.maturity_score = round((maturity_points / max_points) * 100, 1)
-
-    return s
+    maturity_score = round((maturity_points / max_points) * 100, 1)
+
+    return Scores(
+        node_count=node_count,
+        edge_count=edge_count,
+        max_depth=max_depth,
+        max_fan_out=max_fan_out,
+        complexity_score=complexity_score,
+        secret_count=secret_count,
+        cross_trigger_count=cross_trigger_count,
+        unpinned_image_count=unpinned_count,
+        missing_doc_types=missing_doc_types,
+        fragility_score=fragility_score,
+        has_caching=has_caching,
+        has_parallelism=has_parallelism,
+        pinned_image_ratio=pinned_image_ratio,
+        doc_coverage=doc_coverage,
+        has_retries=has_retries,
+        has_env_isolation=has_env_isolation,
+        maturity_score=maturity_score,
+    )
 
 
-def _compute_depth(graph: CICDGraph, node_id: str, visited: set[str]) -> int:
-    """Recursively compute the depth from a node following CALLS edges."""
-    if node_id in visited:
-        return 0
-    visited.add(node_id)
-    children = [
-        e.target_node_id for e in graph.edges
-        if e.source_node_id == node_id and e.edge_type == EdgeType.CALLS
-    ]
-    if not children:
-        return 1
-    return 1 + max(_compute_depth(graph, c, visited) for c in children)
+def _doc_type_str(n: Any) -> str:
+    """Doc type of a DOC_FILE node as a plain string.
+
+    The happy path (enum-valued ``doc_type``) is a single attribute
+    access; nodes with a missing or plain-string doc_type fall through
+    the except branch.
+    """
+    try:
+        return n.doc_type.value
+    except AttributeError:
+        return str(getattr(n, "doc_type", ""))
+
+
+def _compute_depth(
+    adj: dict[str, list[str]],
+    node_id: str,
+    cache: dict[str, int],
+    in_progress: set[str],
+) -> int:
+    """Compute the depth from a node following CALLS adjacency.
+
+    Iterative post-order DFS — no recursion, so arbitrarily deep CALLS
+    chains cannot hit the interpreter stack limit. Depths are cached per
+    node so subgraphs shared between pipelines are only traversed once;
+    `in_progress` guards against cycles (back-edges contribute 0).
+    """
+    cached = cache.get(node_id)
+    if cached is not None:
+        return cached
+    in_progress.add(node_id)
+    stack = [(node_id, iter(adj.get(node_id, ())))]
+    while stack:
+        node, children = stack[-1]
+        child = next(children, None)
+        if child is not None:
+            if child in cache or child in in_progress:
+                continue
+            in_progress.add(child)
+            stack.append((child, iter(adj.get(child, ()))))
+        else:
+            stack.pop()
+            in_progress.discard(node)
+            cache[node] = 1 + max(
+                (cache.get(c, 0) for c in adj.get(node, ())), default=0
+            )
+    return cache[node_id]
@@ -1,5 +1,6 @@
 """Unit tests for atlas-report — scorer, renderers, generator."""
 
+import io
 import json
 
 import pytest
@@ -21,7 +22,7 @@ from atlas_sdk.models.nodes import (
 )
 
 from atlas_report.generator import ReportGenerator
-from atlas_report.json_renderer import build_json_dict, render_json
+from atlas_report.json_renderer import build_json_dict, render_json, render_json_stream
 from atlas_report.markdown_renderer import render_markdown
 from atlas_report.report_data import ReportData
 from atlas_report.scorer import Scores, compute_scores
@@ -184,6 +185,40 @@ class TestJsonRenderer:
         assert len(d["findings"]) == 2
         assert len(d["dependencies"]) == 5
 
+    def test_finding_shape(self):
+        data = ReportData(
+            graph=_sample_graph(),
+            findings=_sample_findings(),
+            scores=compute_scores(_sample_graph()),
+        )
+        parsed = json.loads(render_json(data))
+        finding = parsed["findings"][0]
+        assert finding["rule_id"] == "no-timeout"
+        assert finding["severity"] == str(Severity.HIGH)
+        assert finding["confidence"] == ConfidenceScore.high().level
+        assert finding["evidence"] == [
+            {"description": "No timeout on pipeline 'main-build'"}
+        ]
+
+    def test_stream_render(self):
+        data = ReportData(
+            graph=_sample_graph(),
+            findings=_sample_findings(),
+            scores=compute_scores(_sample_graph()),
+        )
+        buf = io.BytesIO()
+        render_json_stream(data, buf)
+        parsed = json.loads(buf.getvalue())
+        assert parsed["meta"]["pipeline"] == "test-pipeline"
+        assert len(parsed["dependencies"]) == 5
+        finding = parsed["findings"][0]
+        assert finding["rule_id"] == "no-timeout"
+        assert finding["severity"] == str(Severity.HIGH)
+        assert finding["confidence"] == ConfidenceScore.high().level
+        assert finding["evidence"] == [
+            {"description": "No timeout on pipeline 'main-build'"}
+        ]
+
     def test_empty_graph_json(self):
         data = ReportData(
             graph=CICDGraph(name="empty"),
@@ -217,6 +252,12 @@ class TestReportGenerator:
         assert data.modernization_notes == "Phase 2 TBD"
         assert data.scores.node_count == 9
 
+    def test_generate_caches_data(self):
+        gen = ReportGenerator()
+        g = _sample_graph()
+        f = _sample_findings()
+        assert gen.generate(g, f) is gen.generate(g, f)
+
     def test_generate_empty(self):
         gen = ReportGenerator()
         md = gen.generate_markdown(CICDGraph(name="empty"), [])